@@ -121,6 +121,9 @@ def main(do_plot=False):
                                                 mpi_interface=mpi_interface
                                                 )
 
+    # Collect the district's buildings once for printing the schedules after the algorithm runs below:
+    buildings = list(district.get_lower_entities())
+
     # Hierarchically print the district and all buildings/assets:
     debug.print_district(district, 2)
 
@@ -133,11 +136,11 @@ def main(do_plot=False):
     district.copy_schedule("central")
 
     # Print the building's schedules and some metrics:
-    for building in district.get_lower_entities():
+    for building in buildings:
         print("Schedule building {}:".format(str(building)))
-        print(list(building.p_el_schedule))
+        print(building.p_el_schedule.tolist())
     print("Schedule of the city district:")
-    print(list(district.p_el_schedule))
+    print(district.p_el_schedule.tolist())
     print("")
     print("Self-consumption rate: {: >4.2f}".format(self_consumption(district)))
     print("Autarky rate: {: >4.2f}".format(autarky(district)))
@@ -149,11 +152,11 @@ def main(do_plot=False):
     district.copy_schedule("dual-decomposition")
 
     # Print the building's schedules:
-    for building in district.get_lower_entities():
+    for building in buildings:
         print("Schedule building {}:".format(str(building)))
-        print(list(building.p_el_schedule))
+        print(building.p_el_schedule.tolist())
     print("Schedule of the city district:")
-    print(list(district.p_el_schedule))
+    print(district.p_el_schedule.tolist())
     print("")
     print("Self-consumption rate: {: >4.2f}".format(self_consumption(district)))
     print("Autarky rate: {: >4.2f}".format(autarky(district)))
@@ -165,11 +168,11 @@ def main(do_plot=False):
     district.copy_schedule("exchange-admm")
 
     # Print the building's schedules:
-    for building in district.get_lower_entities():
+    for building in buildings:
         print("Schedule building {}:".format(str(building)))
-        print(list(building.p_el_schedule))
+        print(building.p_el_schedule.tolist())
     print("Schedule of the city district:")
-    print(list(district.p_el_schedule))
+    print(district.p_el_schedule.tolist())
     print("")
     print("Self-consumption rate: {: >4.2f}".format(self_consumption(district)))
     print("Autarky rate: {: >4.2f}".format(autarky(district)))
@@ -184,11 +187,11 @@ def main(do_plot=False):
     district.copy_schedule("exchange_miqp_admm-constrained")
 
     # Print the building's schedules:
-    for building in district.get_lower_entities():
+    for building in buildings:
         print("Schedule building {}:".format(str(building)))
-        print(list(building.p_el_schedule))
+        print(building.p_el_schedule.tolist())
     print("Schedule of the city district:")
-    print(list(district.p_el_schedule))
+    print(district.p_el_schedule.tolist())
     print("")
     print("Self-consumption rate: {: >4.2f}".format(self_consumption(district)))
     print("Autarky rate: {: >4.2f}".format(autarky(district)))
@@ -1,24 +1,42 @@
+import functools
 import http.server
-import socketserver
 import os
 
 PORT = 8000
 
 # Define handler to serve files from current directory
 class MyHandler(http.server.SimpleHTTPRequestHandler):
+    # HTTP/1.1 keeps connections open by default, so the browser can fetch the page and its assets over a single
+    # connection; idle connections are closed after the timeout so they do not hold a handler thread forever
+    protocol_version = "HTTP/1.1"
+    timeout = 30
+
     def do_GET(self):
-        if self.path == '/':
+        if self.path == '/' and os.path.isfile(os.path.join(self.directory, 'index.html')):
             self.path = 'index.html'
         return http.server.SimpleHTTPRequestHandler.do_GET(self)
 
+
+def serve(directory, port=PORT):
+    """
+    Serve the files in directory over HTTP until interrupted.
+
+    Parameters
+    ----------
+    directory : str
+        Directory to serve files from.
+    port : int, optional
+        Port to listen on.
+    """
+    handler = functools.partial(MyHandler, directory=directory)
+    with http.server.ThreadingHTTPServer(("", port), handler) as httpd:
+        httpd.serve_forever()
+
+
 # Start the server
 if __name__ == "__main__":
     web_dir = os.path.join(os.path.dirname(__file__), 'web')
-    os.chdir(web_dir)
-
-    handler = MyHandler
-    httpd = socketserver.TCPServer(("", PORT), handler)
 
     print(f"Serving at port {PORT}")
     print(f"Open your browser and go to http://localhost:{PORT}/")
-    httpd.serve_forever()
+    serve(web_dir)
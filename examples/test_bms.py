@@ -23,11 +23,9 @@ OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 
 import numpy as np
 import os
-import http.server
-import socketserver
+from concurrent.futures import ThreadPoolExecutor
 import plotly.graph_objs as go
 import plotly.io as pio
-from plotly.subplots import make_subplots
 
 import pycity_scheduling.util.factory as factory
 from pycity_scheduling.classes import *
@@ -78,72 +76,94 @@ def main(do_plot=False):
     results = opt.solve()
     cd.copy_schedule("central")
 
+    # Plot the schedules of interest:
+    plot_time = np.arange(env.timer.timesteps_used_horizon, dtype=np.int32)
+
+    if do_plot:
+        # Gather the plotted schedules into one contiguous array with one row per schedule:
+        BUILDING_P, BAT1_P, BAT1_E, BAT2_P, BAT2_E = range(5)
+        schedules = np.stack([bd.p_el_schedule, bat.p_el_schedule, bat.e_el_schedule, bat2.p_el_schedule,
+                              bat2.e_el_schedule])
+
+        # Build the figure in one go from raw trace dicts instead of make_subplots plus one add_trace call per row. The
+        # rows are laid out by hand the same way make_subplots does it with subplot titles:
+        rows = [
+            ("Energy Prices - Forecasted", 'Prices - Forecasted [€/MWh]', env.prices.da_prices),
+            ("Grid Load - Forecasted", 'Grid Load - Forecasted', schedules[BUILDING_P]),
+            # ("Fixed Load", 'Grid Load Forecasts [kW]', fl.p_el_schedule),
+            ("Battery-1 Power", 'Battery 1 [kW]', schedules[BAT1_P]),
+            ("Battery-1 Energy", 'Battery 1 [kWh]', schedules[BAT1_E]),
+            ("Battery-2 Power", 'Battery 2[kW]', schedules[BAT2_P]),
+            ("Battery-2 Energy", 'Battery 2[kWh]', schedules[BAT2_E]),
+        ]
+        spacing = 0.5 / len(rows)
+        row_height = (1.0 - spacing * (len(rows) - 1)) / len(rows)
+
+        data = []
+        layout = dict(height=1500, title_text="Schedules : Peak Shaving ", annotations=[])
+        for i, (title, name, values) in enumerate(rows):
+            suffix = str(i + 1) if i > 0 else ''
+            bottom = (len(rows) - 1 - i) * (row_height + spacing)
+            top = bottom + row_height
+            data.append(dict(type='scatter', x=plot_time, y=values, mode='lines', name=name,
+                             xaxis='x' + suffix, yaxis='y' + suffix))
+            layout['xaxis' + suffix] = dict(domain=[0.0, 1.0], anchor='y' + suffix)
+            layout['yaxis' + suffix] = dict(domain=[bottom, top], anchor='x' + suffix)
+            layout['annotations'].append(dict(text=title, x=0.5, y=top, xref='paper', yref='paper', xanchor='center',
+                                              yanchor='bottom', showarrow=False, font=dict(size=16)))
+        layout['xaxis']['title'] = dict(text='Time')
+        layout['yaxis']['title'] = dict(text='Power/Energy')
+
+        fig = go.Figure(data=data, layout=layout)
+
+        # Render the HTML page in a background thread so that it overlaps with printing the schedules below. plotly.js
+        # is referenced from the CDN instead of embedding the bundle into the generated page:
+        executor = ThreadPoolExecutor(max_workers=1)
+        html_future = executor.submit(pio.to_html, fig, include_plotlyjs='cdn', full_html=True)
+
     # Print schedules and other info
     print('\nBuilding Electrical Schedule:')
-    print(list(bd.p_el_schedule))
-    
+    print(bd.p_el_schedule.tolist())
+
     print('\nFixed Load Schedule:')
-    print(list(fl.p_el_schedule))
-    
+    print(fl.p_el_schedule.tolist())
+
     print('\nBattery Power Schedule:')
-    print(list(bat.p_el_schedule))
-    
+    print(bat.p_el_schedule.tolist())
+
     print('\nBattery Energy Schedule:')
-    print(list(bat.e_el_schedule))
-    
+    print(bat.e_el_schedule.tolist())
+
     print('\nBattery 2 Power Schedule:')
-    print(list(bat2.p_el_schedule))
-    
-    print('\nBattery 2 Energy Schedule:')
-    print(list(bat2.e_el_schedule))
-
- # Gather the schedules
-    schedules = {
-        "building_power": bd.p_el_schedule,
-        "fixed_load": fl.p_el_schedule,
-        "battery1_power": bat.p_el_schedule,
-        "battery1_energy": bat.e_el_schedule,
-        "battery2_energy": bat2.e_el_schedule,
-        "battery2_power": bat2.p_el_schedule
-    }
+    print(bat2.p_el_schedule.tolist())
 
-    # Plot the schedules of interest:
-    plot_time = list(range(env.timer.timesteps_used_horizon))
+    print('\nBattery 2 Energy Schedule:')
+    print(bat2.e_el_schedule.tolist())
 
     if do_plot:
-        fig = make_subplots(rows=6, cols=1, subplot_titles=("Energy Prices - Forecasted", "Grid Load - Forecasted", "Battery-1 Power", "Battery-1 Energy","Battery-2 Power","Battery-2 Energy"))
-
-        fig.add_trace(go.Scatter(x=plot_time, y=env.prices.da_prices, mode='lines', name='Prices - Forecasted [€/MWh]'), row=1, col=1)
-        fig.add_trace(go.Scatter(x=plot_time, y=schedules["building_power"], mode='lines', name='Grid Load - Forecasted'), row=2, col=1)
-        # fig.add_trace(go.Scatter(x=plot_time, y=schedules["fixed_load"], mode='lines', name='Grid Load Forecasts [kW]'), row=3, col=1)
-        fig.add_trace(go.Scatter(x=plot_time, y=schedules["battery1_power"], mode='lines', name='Battery 1 [kW]'), row=3, col=1)
-        fig.add_trace(go.Scatter(x=plot_time, y=schedules["battery1_energy"], mode='lines', name='Battery 1 [kWh]'), row=4, col=1)
-        fig.add_trace(go.Scatter(x=plot_time, y=schedules["battery2_power"], mode='lines', name='Battery 2[kW]'), row=5, col=1)
-        fig.add_trace(go.Scatter(x=plot_time, y=schedules["battery2_energy"], mode='lines', name='Battery 2[kWh]'), row=6, col=1)
-
-        fig.update_layout(
-            height=1500,
-            title_text="Schedules : Peak Shaving ",
-            xaxis_title='Time',
-            yaxis_title='Power/Energy'
-        )
-
         html_file = 'plot_peak_shaving.html'
         try:
-            pio.write_html(fig, file=html_file, auto_open=False)
+            html = html_future.result()
+            with open(html_file, 'w', encoding='utf-8') as f:
+                f.write(html)
             print("HTML file created successfully.")
         except Exception as e:
             print(f"Error creating HTML file: {e}")
+        finally:
+            # Join the render thread before the server takes over the process:
+            executor.shutdown()
 
         # Start a simple HTTP server to serve the HTML file
+        if __package__:
+            from .out_htmls.server import serve
+        else:
+            # Run as a script from within the examples directory:
+            from out_htmls.server import serve
         try:
             port = 8000
-            os.chdir(os.path.dirname(os.path.abspath(html_file)))
-            handler = http.server.SimpleHTTPRequestHandler
-            httpd = socketserver.TCPServer(("", port), handler)
             print(f"Serving at port {port}")
             print(f"Open your browser and go to http://localhost:{port}/{html_file}")
-            httpd.serve_forever()
+            serve(os.path.dirname(os.path.abspath(html_file)), port=port)
         except Exception as e:
             print(f"Error starting HTTP server: {e}")
 